@@ -0,0 +1,114 @@
+"""Startup benchmark: time-to-first-answer after a (simulated) container restart.
+
+Every run starts a fresh Python process, like a restarted container, and measures:
+    - import:    importing main.py (telegram stack, no TMDB yet)
+    - bootstrap: bootstrap_tmdb() as run by post_init (pool, genres, image config, cache)
+    - answer:    the first search plus a caption (with trailer lookup) for each of the first
+                 10 results with a poster, as the inline handler does
+    - hits/miss: cache hits and misses while answering
+    - total:     wall time of the whole process until the answer is ready
+
+The first run starts without a cache snapshot (cold), the next ones reuse the
+snapshot written by the previous run (warm), like a restart with the cache volume.
+The snapshot only holds movie/TV details and trailer lookups: the two search
+requests are always sent to TMDB, so they are part of every "answer" time.
+
+Usage:
+    TMDB_API=... python bench_startup.py [--query Inception] [--runs 3] [--max-seconds 5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def child(query: str, cache_path: str):
+    """Run a single startup inside this (fresh) process and print the timings as json."""
+    import asyncio
+
+    t0 = time.perf_counter()
+    import main
+    t1 = time.perf_counter()
+    asyncio.run(main.bootstrap_tmdb(os.environ["TMDB_API"], cache_path))
+    t2 = time.perf_counter()
+    results = main.tmdb.search(query)
+    # same work as inline_query: a caption for each of the first 10 results with a poster
+    for result in results[:10]:
+        if result.poster_path:
+            main.tmdb.print_result(result)
+    t3 = time.perf_counter()
+    main.tmdb.save_cache()
+
+    print(json.dumps({
+        "import": t1 - t0,
+        "bootstrap": t2 - t1,
+        "answer": t3 - t2,
+        "results": len(results),
+        "hits": main.tmdb.cache_hits,
+        "misses": main.tmdb.cache_misses,
+    }))
+
+
+def run_once(query: str, cache_path: str) -> dict:
+    """Start a fresh interpreter for one startup and collect its timings."""
+    start = time.perf_counter()
+    try:
+        proc = subprocess.run(
+            [sys.executable, __file__, "--child", "--query", query, "--cache-path", cache_path],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+    except subprocess.CalledProcessError as e:
+        print(f"❌ benchmark run failed with exit status {e.returncode}:", file=sys.stderr)
+        print(e.stderr, file=sys.stderr)
+        sys.exit(e.returncode)
+    total = time.perf_counter() - start
+    timings = json.loads(proc.stdout.strip().splitlines()[-1])
+    timings["total"] = total
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--query", default="Inception", help="title searched for the first answer")
+    parser.add_argument("--runs", type=int, default=3, help="number of restarts, the first one is cold")
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="fail if a warm restart takes longer than this to answer")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--cache-path", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.query, args.cache_path)
+        return
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    if not os.getenv("TMDB_API"):
+        raise ValueError("TMDB_API environment variable is not set.")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_path = os.path.join(tmp_dir, "tmdb_cache.json")
+        runs = [run_once(args.query, cache_path) for _ in range(args.runs)]
+
+    print(f"{'run':<8}{'import':>10}{'bootstrap':>11}{'answer':>10}{'total':>10}{'hits/miss':>11}")
+    for i, timings in enumerate(runs):
+        label = "cold" if i == 0 else f"warm {i}"
+        print(f"{label:<8}{timings['import']:>9.3f}s{timings['bootstrap']:>10.3f}s"
+              f"{timings['answer']:>9.3f}s{timings['total']:>9.3f}s"
+              f"{timings['hits']:>7}/{timings['misses']}")
+
+    warm = runs[1:]
+    if args.max_seconds is not None and warm:
+        worst = max(timings["total"] for timings in warm)
+        if worst > args.max_seconds:
+            print(f"❌ warm time-to-first-answer {worst:.3f}s is above {args.max_seconds:.3f}s")
+            sys.exit(1)
+        print(f"✅ warm time-to-first-answer {worst:.3f}s is within {args.max_seconds:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,39 +1,92 @@
+import asyncio
 import os
 import uuid
 from telegram import Update, ReplyKeyboardMarkup, KeyboardButton, ReplyKeyboardRemove, InlineQueryResultPhoto
-from telegram.ext import ApplicationBuilder, CommandHandler, ContextTypes, MessageHandler, filters, InlineQueryHandler
-from dotenv import load_dotenv
-from tmdb_wrapper import TMDB_WRAPPER, TMDB_RESULT
+from telegram.ext import Application, ApplicationBuilder, CommandHandler, ContextTypes, MessageHandler, filters, InlineQueryHandler
 
 
-# Load environment variables from .env file
-load_dotenv()
+# Configuration is read in load_config() and the tmdb wrapper is created in
+# post_init(), so importing this module stays cheap (see bench_startup.py)
+TELEGRAM_TOKEN = None
+TMDB_API = None
+CHANNEL_ID = None
+MY_CHAT_ID = None
+TMDB_CACHE_PATH = None
 
-# read the Telegram bot token from environment variable
-TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
-TMDB_API = os.getenv("TMDB_API")
-CHANNEL_ID = os.getenv("CHANNEL_ID")
-MY_CHAT_ID = os.getenv("MY_CHAT_ID")
+tmdb = None
+cache_save_task = None
 
-if not TELEGRAM_TOKEN:
-    raise ValueError("TELEGRAM_TOKEN environment variable is not set.")
+# Store the current search result for the authorized user
+current_search_result = None
+waiting_for_notes = False
 
-if not TMDB_API:
-    raise ValueError("TMDB_API environment variable is not set.")
+def load_config():
+    """Read the bot configuration from the environment and the .env file."""
+    global TELEGRAM_TOKEN, TMDB_API, CHANNEL_ID, MY_CHAT_ID, TMDB_CACHE_PATH
+    from dotenv import load_dotenv
 
-if not CHANNEL_ID:
-    raise ValueError("CHANNEL_ID environment variable is not set.")
+    # Load environment variables from .env file
+    load_dotenv()
 
-if not MY_CHAT_ID:
-    raise ValueError("MY_CHAT_ID environment variable is not set.")
+    # read the Telegram bot token from environment variable
+    TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
+    TMDB_API = os.getenv("TMDB_API")
+    CHANNEL_ID = os.getenv("CHANNEL_ID")
+    MY_CHAT_ID = os.getenv("MY_CHAT_ID")
+    TMDB_CACHE_PATH = os.getenv("TMDB_CACHE_PATH", "tmdb_cache.json")
 
+    if not TELEGRAM_TOKEN:
+        raise ValueError("TELEGRAM_TOKEN environment variable is not set.")
 
-#create a tmdb wrapper
-tmdb = TMDB_WRAPPER(TMDB_API)
+    if not TMDB_API:
+        raise ValueError("TMDB_API environment variable is not set.")
 
-# Store the current search result for the authorized user
-current_search_result = None
-waiting_for_notes = False
+    if not CHANNEL_ID:
+        raise ValueError("CHANNEL_ID environment variable is not set.")
+
+    if not MY_CHAT_ID:
+        raise ValueError("MY_CHAT_ID environment variable is not set.")
+
+async def bootstrap_tmdb(api: str, cache_path: str | None = None):
+    """Create the tmdb wrapper and warm it up before the first update is served."""
+    global tmdb
+
+    def open_wrapper():
+        # tmdbsimple pulls in requests, so import it off the event loop
+        from tmdb_wrapper import TMDB_WRAPPER
+        wrapper = TMDB_WRAPPER(api, cache_path)
+        wrapper.open_pool()
+        return wrapper
+
+    wrapper = await asyncio.to_thread(open_wrapper)
+
+    # genre tables, image configuration and cache snapshot are independent
+    await asyncio.gather(
+        asyncio.to_thread(wrapper.load_genres),
+        asyncio.to_thread(wrapper.load_image_config),
+        asyncio.to_thread(wrapper.load_cache),
+    )
+    tmdb = wrapper
+
+async def save_cache_periodically():
+    """Write the TMDB cache snapshot off the event loop while there are new entries."""
+    while True:
+        await asyncio.sleep(tmdb.cache_save_interval)
+        if tmdb.cache_dirty:
+            await asyncio.to_thread(tmdb.save_cache)
+
+async def post_init(application: Application):
+    """Bootstrap TMDB once the bot is initialized and before polling starts."""
+    global cache_save_task
+    await bootstrap_tmdb(TMDB_API, TMDB_CACHE_PATH)
+    cache_save_task = asyncio.create_task(save_cache_periodically())
+
+async def post_shutdown(application: Application):
+    """Persist the TMDB cache so the next start begins warm."""
+    if cache_save_task:
+        cache_save_task.cancel()
+    if tmdb:
+        await asyncio.to_thread(tmdb.save_cache)
 
 # No conversation states needed anymore
 
@@ -439,14 +492,24 @@ async def handle_extra_notes(update: Update, context: ContextTypes.DEFAULT_TYPE,
             reply_markup=keyboard
         )
 
-#create telegram app
-app = ApplicationBuilder().token(TELEGRAM_TOKEN).build()
+def main():
+    load_config()
 
-# Add handlers
-app.add_handler(CommandHandler("start", start))
-app.add_handler(InlineQueryHandler(inline_query))
-app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, search_query_handler))
+    #create telegram app
+    app = (
+        ApplicationBuilder()
+        .token(TELEGRAM_TOKEN)
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
+    )
 
-app.run_polling()
+    # Add handlers
+    app.add_handler(CommandHandler("start", start))
+    app.add_handler(InlineQueryHandler(inline_query))
+    app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, search_query_handler))
 
+    app.run_polling()
 
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,20 @@
-from httpx import URL
-import tmdbsimple as tmdb 
+import json
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+import tmdbsimple as tmdb
+
+class KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter that drops the 'Connection: close' header tmdbsimple adds to every request,
+    otherwise the server closes the socket and pooled connections are never reused"""
+
+    def send(self, request, **kwargs):
+        if request.headers.get('Connection', '').lower() == 'close':
+            del request.headers['Connection']
+        return super().send(request, **kwargs)
 
 class Genre:
     def __init__(self, data):
@@ -99,10 +114,111 @@ class TMDB_RESULT:
 
 
 class TMDB_WRAPPER:
-    
-    def __init__(self, api:str):
+
+    # cached details older than this are fetched again (seconds)
+    cache_ttl = 24 * 60 * 60
+    # least recently used entries are evicted above this size
+    cache_max_entries = 5000
+    # while there are new entries the bot writes the snapshot this often (seconds)
+    cache_save_interval = 10 * 60
+
+    def __init__(self, api:str, cache_path:str|None=None):
         self.API_KEY = api
         tmdb.API_KEY = api
+        self.cache_path = cache_path
+        # raw TMDB responses keyed by "<kind>:<id>", each stored as {"ts": ..., "data": ...},
+        # kept in least to most recently used order
+        self.cache: dict[str, dict] = {}
+        # set when new entries are added, cleared by save_cache()
+        self.cache_dirty = False
+        self._save_lock = threading.Lock()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        # genre id -> name tables, filled by load_genres()
+        self.genres: dict[str, dict[int, str]] = {}
+
+    def open_pool(self, pool_size:int=10):
+        """Open a shared HTTP session so TMDB requests reuse connections"""
+        session = requests.Session()
+        adapter = KeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        tmdb.REQUESTS_SESSION = session
+
+    def load_genres(self):
+        """Load movie and TV genre tables once instead of on every caption"""
+        try:
+            movie_genres = tmdb.Genres().movie_list().get('genres', [])
+            tv_genres = tmdb.Genres().tv_list().get('genres', [])
+            self.genres = {
+                "movie": {genre['id']: genre['name'] for genre in movie_genres},
+                "tv-show": {genre['id']: genre['name'] for genre in tv_genres},
+            }
+        except Exception as e:
+            print(f"Error loading genres: {e}")
+
+    def load_image_config(self):
+        """Load poster base URL and sizes from the TMDB configuration"""
+        try:
+            images = tmdb.Configuration().info().get('images', {})
+            base_url = images.get('secure_base_url')
+            sizes = images.get('poster_sizes', [])
+            if not base_url:
+                return
+            if "original" in sizes:
+                TMDB_RESULT.img_path = base_url + "original"
+            if "w500" in sizes:
+                TMDB_RESULT.thumbnail_path = base_url + "w500"
+        except Exception as e:
+            print(f"Error loading image configuration: {e}")
+
+    def load_cache(self):
+        """Load the persisted cache snapshot, dropping expired entries"""
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            now = time.time()
+            entries = [(key, entry) for key, entry in snapshot.items()
+                       if now - entry.get('ts', 0) < self.cache_ttl]
+            self.cache = dict(entries[-self.cache_max_entries:])
+        except Exception as e:
+            print(f"Error loading TMDB cache: {e}")
+
+    def save_cache(self):
+        """Persist the cache snapshot so it survives a restart"""
+        if not self.cache_path:
+            return
+        # may run in a worker thread: copy the entries before filtering and serializing them
+        self.cache_dirty = False
+        with self._save_lock:
+            try:
+                now = time.time()
+                snapshot = {key: entry for key, entry in list(self.cache.items())
+                            if now - entry.get('ts', 0) < self.cache_ttl}
+                tmp_path = self.cache_path + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f)
+                os.replace(tmp_path, self.cache_path)
+            except Exception as e:
+                self.cache_dirty = True
+                print(f"Error saving TMDB cache: {e}")
+
+    def _cached(self, key:str, fetch):
+        """Return cached raw data for key, calling fetch() on a miss"""
+        entry = self.cache.pop(key, None)
+        if entry and time.time() - entry.get('ts', 0) < self.cache_ttl:
+            # re-insert to mark the entry as most recently used
+            self.cache[key] = entry
+            self.cache_hits += 1
+            return entry['data']
+        self.cache_misses += 1
+        data = fetch()
+        self.cache[key] = {'ts': time.time(), 'data': data}
+        while len(self.cache) > self.cache_max_entries:
+            del self.cache[next(iter(self.cache))]
+        self.cache_dirty = True
+        return data
     
     def search(self, title: str) -> list[TMDB_RESULT]:
         """Search for movies and TV shows"""
@@ -132,8 +248,7 @@ class TMDB_WRAPPER:
     def get_movie(self, movie_id: int) -> TMDB_RESULT | None:
         """Get movie details by ID"""
         try:
-            movie = tmdb.Movies(movie_id)
-            data = movie.info()
+            data = self._cached(f"movie:{movie_id}", lambda: tmdb.Movies(movie_id).info())
             return TMDB_RESULT(data)
         except Exception as e:
             print(f"Error getting movie details: {e}")
@@ -142,8 +257,7 @@ class TMDB_WRAPPER:
     def get_tv_show(self, tv_id: int) -> TMDB_RESULT | None:
         """Get TV show details by ID"""
         try:
-            tv = tmdb.TV(tv_id)
-            data = tv.info()
+            data = self._cached(f"tv:{tv_id}", lambda: tmdb.TV(tv_id).info())
             return TMDB_RESULT(data)
         except Exception as e:
             print(f"Error getting TV show details: {e}")
@@ -155,11 +269,10 @@ class TMDB_WRAPPER:
         if len(result.genres_ids) == 0 and len(result.genres)!= 0:
             genres = [genre['name'] for genre in result.genres]
         elif len(result.genres_ids) > 0:
-            if result.media_type == "movie":
-                x_genres = tmdb.Genres().movie_list().get('genres', [])
-            else:
-                x_genres = tmdb.Genres().tv_list().get('genres', [])
-            genres = [genre['name'] for genre in x_genres if genre['id'] in result.genres_ids]
+            if not self.genres:
+                self.load_genres()
+            x_genres = self.genres.get(result.media_type, {})
+            genres = [x_genres[genre_id] for genre_id in result.genres_ids if genre_id in x_genres]
         else:
             genres = []
 
@@ -199,9 +312,10 @@ class TMDB_WRAPPER:
         """Find YouTube trailer for a movie or TV show"""
         try:
             if result.media_type == "movie":
-                video = tmdb.Movies(result.id).videos().get('results', [])
+                data = self._cached(f"movie-videos:{result.id}", lambda: tmdb.Movies(result.id).videos())
             else:
-                video = tmdb.TV(result.id).videos().get('results', [])
+                data = self._cached(f"tv-videos:{result.id}", lambda: tmdb.TV(result.id).videos())
+            video = data.get('results', [])
             
             for item in video:
                 if item['site'] == 'YouTube' and item['type'] == 'Trailer' and item['size'] == 1080: